@@ -1,5 +1,5 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Request, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from app.models.data_models import APIResponse, HealthCheck
 from app.services.sheet_service import SheetService, SheetServiceError
@@ -43,15 +43,10 @@ async def get_data():
         logger.info("Requisição de dados via API REST")
         
         sheet_data = await sheet_service.fetch_sheet_data()
-        
-        data_list = [record.data for record in sheet_data.records]
-        
-        return APIResponse(
-            success=True,
-            data=data_list,
-            message="Dados obtidos com sucesso",
-            total_records=sheet_data.total_records,
-            timestamp=sheet_data.timestamp
+
+        return Response(
+            content=sheet_data.to_api_payload(),
+            media_type="application/json"
         )
         
     except SheetServiceError as e:
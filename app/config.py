@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass
 from typing import Optional
 from pydantic import validator
 from pydantic_settings import BaseSettings
@@ -41,11 +42,26 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-_settings: Optional[Settings] = None
+@dataclass(frozen=True, slots=True)
+class RuntimeSettings:
+    app_name: str
+    app_description: str
+    debug: bool
+    host: str
+    port: int
+    sheet_url: str
+    update_interval_seconds: int
+    max_connections: int
+    request_timeout: int
+    max_retries: int
+    log_level: str
 
 
-def get_settings() -> Settings:
+_settings: Optional[RuntimeSettings] = None
+
+
+def get_settings() -> RuntimeSettings:
     global _settings
     if _settings is None:
-        _settings = Settings()
+        _settings = RuntimeSettings(**Settings().dict())
     return _settings
\ No newline at end of file
@@ -3,7 +3,6 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from app.config import get_settings
 from app.api.routes import router, notify_data_update, notify_error, sheet_service
@@ -13,38 +12,45 @@ settings = get_settings()
 setup_logging()
 logger = get_logger("main")
 
-scheduler: AsyncIOScheduler = None
+WEBSOCKET_CLEANUP_INTERVAL_SECONDS = 300
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Iniciando aplicação Desafio Python Alpha")
-    
+
+    background_tasks = []
+
     try:
         logger.info("Carregando dados iniciais...")
         initial_data = await sheet_service.fetch_sheet_data()
         logger.info(f"Dados iniciais carregados: {initial_data.total_records} registros")
-        
-        await setup_scheduler()
-        logger.info("Scheduler configurado e iniciado")
-        
+
+        background_tasks = start_background_tasks()
+        logger.info(f"Tarefas periódicas iniciadas - Intervalo: {settings.update_interval_seconds}s")
+
         logger.info("✅ Aplicação iniciada com sucesso!")
-        
+
     except Exception as e:
         logger.error(f"❌ Erro durante inicialização: {e}")
-    
+
     yield
-    
+
     logger.info("Finalizando aplicação...")
-    
+
     try:
-        if scheduler and scheduler.running:
-            scheduler.shutdown(wait=False)
-            logger.info("Scheduler finalizado")
-            
+        if background_tasks:
+            for task in background_tasks:
+                task.cancel()
+            await asyncio.gather(*background_tasks, return_exceptions=True)
+            logger.info("Tarefas periódicas finalizadas")
+
+        await sheet_service.aclose()
+        logger.info("Cliente HTTP finalizado")
+
     except Exception as e:
         logger.error(f"Erro durante finalização: {e}")
-    
+
     logger.info("👋 Aplicação finalizada")
 
 
@@ -66,52 +72,43 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
     
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+    app.mount(
+        "/static",
+        StaticFiles(directory="static", check_dir=False, html=False),
+        name="static"
+    )
     
     app.include_router(router)
     
     return app
 
 
-async def setup_scheduler():
-    global scheduler
-    
-    try:
-        scheduler = AsyncIOScheduler()
-        
-        scheduler.add_job(
-            update_data_job,
-            'interval',
-            seconds=settings.update_interval_seconds,
-            id='update_sheet_data',
-            name='Atualização automática da planilha',
-            max_instances=1  
-        )
-        
-        scheduler.add_job(
-            cleanup_websockets_job,
-            'interval',
-            minutes=5,
-            id='cleanup_websockets',
-            name='Limpeza de conexões WebSocket',
-            max_instances=1
-        )
-        
-        scheduler.start()
-        logger.info(f"Scheduler configurado - Intervalo: {settings.update_interval_seconds}s")
-        
-    except Exception as e:
-        logger.error(f"Erro ao configurar scheduler: {e}")
-        raise
+def start_background_tasks() -> list:
+    return [
+        asyncio.create_task(update_data_loop(), name='update_sheet_data'),
+        asyncio.create_task(cleanup_websockets_loop(), name='cleanup_websockets')
+    ]
+
+
+async def update_data_loop():
+    while True:
+        await asyncio.sleep(settings.update_interval_seconds)
+        await update_data_job()
+
+
+async def cleanup_websockets_loop():
+    while True:
+        await asyncio.sleep(WEBSOCKET_CLEANUP_INTERVAL_SECONDS)
+        await cleanup_websockets_job()
 
 
 async def update_data_job():
     try:
         logger.debug("Executando atualização automática...")
-        
-        new_data = await sheet_service.fetch_sheet_data()
-        
-        if sheet_service.has_data_changed(new_data):
+
+        new_data = await sheet_service.fetch_if_changed()
+
+        if new_data is not None:
             logger.info("Dados modificados, notificando clientes")
             await notify_data_update(new_data)
         else:
@@ -146,5 +143,8 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        ws="websockets"
     )
\ No newline at end of file
@@ -1,6 +1,9 @@
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, validator
+
+import msgspec
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from enum import Enum
 
 
@@ -12,21 +15,13 @@ class WebSocketMessageType(str, Enum):
     PONG = "pong"
 
 
-class SheetRecord(BaseModel):
-    data: Dict[str, Any] = Field(..., description="Dados do registro")
-    
-    @validator('data')
-    def validate_data(cls, v):
-        if not isinstance(v, dict):
-            raise ValueError('data must be a dictionary')
-        return v
-
-
 class SheetData(BaseModel):
-    records: List[SheetRecord] = Field(default_factory=list)
+    records: List[Dict[str, Any]] = Field(default_factory=list)
     total_records: int = Field(0, ge=0)
     timestamp: datetime = Field(default_factory=datetime.now)
-    
+
+    _payload_cache: Dict[str, bytes] = PrivateAttr(default_factory=dict)
+
     @validator('total_records', always=True)
     def validate_total_records(cls, v, values):
         records = values.get('records', [])
@@ -34,11 +29,41 @@ class SheetData(BaseModel):
             return len(records)
         return v
 
+    def to_ws_payload(self, message_type: WebSocketMessageType) -> bytes:
+        payload = self._payload_cache.get(message_type)
+
+        if payload is None:
+            message = WebSocketMessage(
+                type=message_type,
+                data=self.records,
+                timestamp=self.timestamp
+            )
+            payload = msgspec.json.encode(message)
+            self._payload_cache[message_type] = payload
 
-class WebSocketMessage(BaseModel):
+        return payload
+
+    def to_api_payload(self) -> bytes:
+        payload = self._payload_cache.get('api_response')
+
+        if payload is None:
+            response = APIResponse(
+                success=True,
+                data=self.records,
+                message="Dados obtidos com sucesso",
+                total_records=self.total_records,
+                timestamp=self.timestamp
+            )
+            payload = orjson.dumps(response.dict())
+            self._payload_cache['api_response'] = payload
+
+        return payload
+
+
+class WebSocketMessage(msgspec.Struct):
     type: WebSocketMessageType
     data: Optional[List[Dict[str, Any]]] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
     message: Optional[str] = None
     error: Optional[str] = None
 
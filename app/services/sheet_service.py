@@ -1,8 +1,10 @@
 import asyncio
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 import httpx
+import xxhash
 from app.config import get_settings
-from app.models.data_models import SheetData, SheetRecord
+from app.models.data_models import SheetData
 from app.utils.data_processor import DataProcessor
 from app.utils.logger import get_logger
 
@@ -19,50 +21,111 @@ class SheetService:
         self.settings = get_settings()
         self.data_processor = DataProcessor()
         self._last_data: Optional[SheetData] = None
-    
+        self._last_hash: Optional[int] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.settings.request_timeout),
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=4)
+        )
+        self._cpu_pool = ProcessPoolExecutor(max_workers=2)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+
     async def fetch_sheet_data(self) -> SheetData:
+        sheet_data = await self.fetch_if_changed()
+
+        if sheet_data is not None:
+            return sheet_data
+
+        logger.debug("Dados inalterados, reutilizando cache")
+        return self._last_data
+
+    async def fetch_if_changed(self) -> Optional[SheetData]:
         try:
             logger.info("Iniciando busca de dados da planilha")
-            
-            timeout = httpx.Timeout(self.settings.request_timeout)
-            
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                csv_content = await self._fetch_with_retry(client)
-                
-                processed_data = await self._process_csv_data(csv_content)
-                
-                sheet_data = SheetData(
-                    records=[SheetRecord(data=record) for record in processed_data],
-                    total_records=len(processed_data)
-                )
-                
-                self._last_data = sheet_data
-                
-                logger.info(f"Dados obtidos com sucesso: {sheet_data.total_records} registros")
-                return sheet_data
-                
+
+            fetch_result = await self._fetch_with_retry()
+
+            if fetch_result is None:
+                logger.debug("Planilha não modificada (HTTP 304), pulando processamento")
+                return None
+
+            csv_content, etag, last_modified = fetch_result
+
+            new_hash = xxhash.xxh3_64(csv_content).intdigest()
+
+            if new_hash == self._last_hash and self._last_data is not None:
+                self._etag = etag
+                self._last_modified = last_modified
+                logger.debug("Hash do CSV inalterado, pulando processamento")
+                return None
+
+            processed_data = await self._process_csv_data(csv_content)
+
+            sheet_data = SheetData(
+                records=processed_data,
+                total_records=len(processed_data)
+            )
+
+            self._last_data = sheet_data
+            self._last_hash = new_hash
+            self._etag = etag
+            self._last_modified = last_modified
+
+            logger.info(f"Dados obtidos com sucesso: {sheet_data.total_records} registros")
+            return sheet_data
+
         except Exception as e:
             logger.error(f"Erro ao buscar dados da planilha: {e}")
             raise SheetServiceError(f"Falha ao obter dados: {e}")
     
-    async def _fetch_with_retry(self, client: httpx.AsyncClient) -> str:
+    async def _fetch_with_retry(self) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
         last_error = None
-        
+
+        conditional_headers = {}
+        if self._etag:
+            conditional_headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            conditional_headers['If-Modified-Since'] = self._last_modified
+
         for attempt in range(1, self.settings.max_retries + 1):
             try:
                 logger.debug(f"Tentativa {attempt}/{self.settings.max_retries}")
-                
-                response = await client.get(self.settings.sheet_url)
-                
+
+                response = await self._client.get(
+                    self.settings.sheet_url,
+                    headers=conditional_headers
+                )
+
                 if response.status_code == 307 and 'location' in response.headers:
                     redirect_url = response.headers['location']
                     logger.debug(f"Seguindo redirect para: {redirect_url}")
-                    response = await client.get(redirect_url)
-                
+                    response = await self._client.get(redirect_url, headers=conditional_headers)
+
+                if response.status_code == 304:
+                    if self._last_data is not None:
+                        logger.debug("Resposta 304 Not Modified")
+                        return None
+
+                    logger.warning("Resposta 304 sem dados em cache, refazendo busca incondicional")
+                    self._etag = None
+                    self._last_modified = None
+                    conditional_headers.clear()
+                    continue
+
                 response.raise_for_status()
-                
-                logger.debug(f"Resposta recebida: {len(response.text)} caracteres")
-                return response.text
+
+                logger.debug(f"Resposta recebida: {len(response.content)} bytes")
+                return (
+                    response.content,
+                    response.headers.get('etag'),
+                    response.headers.get('last-modified')
+                )
                 
             except httpx.RequestError as e:
                 last_error = e
@@ -83,20 +146,21 @@ class SheetService:
         
         raise SheetServiceError(f"Todas as {self.settings.max_retries} tentativas falharam. Último erro: {last_error}")
     
-    async def _process_csv_data(self, csv_content: str) -> List[Dict[str, Any]]:
+    async def _process_csv_data(self, csv_content: bytes) -> List[Dict[str, Any]]:
         try:
             loop = asyncio.get_event_loop()
             
-            raw_data = await loop.run_in_executor(
-                None, 
-                self.data_processor.parse_csv_content, 
+            fieldnames, rows = await loop.run_in_executor(
+                self._cpu_pool,
+                self.data_processor.parse_csv_content,
                 csv_content
             )
-            
+
             processed_data = await loop.run_in_executor(
-                None,
+                self._cpu_pool,
                 self.data_processor.clean_and_format_data,
-                raw_data
+                fieldnames,
+                rows
             )
             
             return processed_data
@@ -106,16 +170,4 @@ class SheetService:
             raise SheetServiceError(f"Falha no processamento: {e}")
     
     def get_cached_data(self) -> Optional[SheetData]:
-        return self._last_data
-    
-    def has_data_changed(self, new_data: SheetData) -> bool:
-        if not self._last_data:
-            return True
-        
-        if self._last_data.total_records != new_data.total_records:
-            return True
-        
-        old_records = [record.data for record in self._last_data.records]
-        new_records = [record.data for record in new_data.records]
-        
-        return old_records != new_records
\ No newline at end of file
+        return self._last_data
\ No newline at end of file
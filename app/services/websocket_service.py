@@ -1,8 +1,9 @@
 
-import json
 import asyncio
-from typing import List, Set
+from typing import Dict, List
 from datetime import datetime
+
+import msgspec
 from fastapi import WebSocket, WebSocketDisconnect
 from app.config import get_settings
 from app.models.data_models import WebSocketMessage, WebSocketMessageType, SheetData
@@ -11,12 +12,15 @@ from app.utils.logger import get_logger
 logger = get_logger("websocket_service")
 
 
+def _encode_message(message: WebSocketMessage) -> bytes:
+    return msgspec.json.encode(message)
+
+
 class WebSocketManager:
     
     def __init__(self):
         self.settings = get_settings()
-        self._active_connections: Set[WebSocket] = set()
-        self._connection_lock = asyncio.Lock()
+        self._active_connections: Dict[int, WebSocket] = {}
     
     @property
     def connection_count(self) -> int:
@@ -31,10 +35,9 @@ class WebSocketManager:
                 return False
             
             await websocket.accept()
-            
-            async with self._connection_lock:
-                self._active_connections.add(websocket)
-            
+
+            self._active_connections[id(websocket)] = websocket
+
             logger.info(f"Nova conexão WebSocket aceita. Total: {self.connection_count}")
             return True
             
@@ -44,80 +47,78 @@ class WebSocketManager:
     
     async def disconnect(self, websocket: WebSocket, reason: str = "Client disconnected") -> None:
         try:
-            async with self._connection_lock:
-                if websocket in self._active_connections:
-                    self._active_connections.remove(websocket)
-                    logger.info(f"Conexão WebSocket removida ({reason}). Total: {self.connection_count}")
-                    
+            if self._active_connections.pop(id(websocket), None) is not None:
+                logger.info(f"Conexão WebSocket removida ({reason}). Total: {self.connection_count}")
+
         except Exception as e:
             logger.error(f"Erro ao desconectar WebSocket: {e}")
     
     async def broadcast_data_update(self, sheet_data: SheetData) -> int:
         if not self._active_connections:
             return 0
-        
-        message = WebSocketMessage(
-            type=WebSocketMessageType.DATA_UPDATE,
-            data=[record.data for record in sheet_data.records],
-            timestamp=sheet_data.timestamp
-        )
-        
-        return await self._broadcast_message(message)
-    
+
+        payload_bytes = sheet_data.to_ws_payload(WebSocketMessageType.DATA_UPDATE)
+
+        return await self._broadcast_payload(payload_bytes)
+
     async def send_initial_data(self, websocket: WebSocket, sheet_data: SheetData) -> bool:
-        message = WebSocketMessage(
-            type=WebSocketMessageType.INITIAL_DATA,
-            data=[record.data for record in sheet_data.records],
-            timestamp=sheet_data.timestamp
-        )
-        
-        return await self._send_message(websocket, message)
-    
+        payload_bytes = sheet_data.to_ws_payload(WebSocketMessageType.INITIAL_DATA)
+
+        return await self._send_payload(websocket, payload_bytes)
+
     async def broadcast_error(self, error_message: str) -> int:
         message = WebSocketMessage(
             type=WebSocketMessageType.ERROR,
             error=error_message
         )
-        
+
         return await self._broadcast_message(message)
-    
+
     async def _broadcast_message(self, message: WebSocketMessage) -> int:
+        return await self._broadcast_payload(_encode_message(message))
+
+    async def _broadcast_payload(self, payload_bytes: bytes) -> int:
         if not self._active_connections:
             return 0
-        
-        connections = list(self._active_connections)
-        message_json = message.json()
-        
+
+        connections = list(self._active_connections.values())
+
+        results = await asyncio.gather(
+            *(websocket.send_bytes(payload_bytes) for websocket in connections),
+            return_exceptions=True
+        )
+
         successful_sends = 0
         failed_connections = []
-        
-        for websocket in connections:
-            try:
-                await websocket.send_text(message_json)
+
+        for websocket, result in zip(connections, results):
+            if not isinstance(result, Exception):
                 successful_sends += 1
-                
-            except WebSocketDisconnect:
+
+            elif isinstance(result, WebSocketDisconnect):
                 failed_connections.append(websocket)
                 logger.debug("Conexão WebSocket desconectada durante broadcast")
-                
-            except Exception as e:
+
+            else:
                 failed_connections.append(websocket)
-                logger.warning(f"Erro ao enviar mensagem via WebSocket: {e}")
+                logger.warning(f"Erro ao enviar mensagem via WebSocket: {result}")
         
         if failed_connections:
-            async with self._connection_lock:
-                for failed_conn in failed_connections:
-                    self._active_connections.discard(failed_conn)
-            
+            for failed_conn in failed_connections:
+                self._active_connections.pop(id(failed_conn), None)
+
             logger.info(f"Removidas {len(failed_connections)} conexões inválidas")
         
         logger.debug(f"Broadcast enviado para {successful_sends}/{len(connections)} conexões")
         return successful_sends
     
     async def _send_message(self, websocket: WebSocket, message: WebSocketMessage) -> bool:
+        return await self._send_payload(websocket, _encode_message(message))
+
+    async def _send_payload(self, websocket: WebSocket, payload_bytes: bytes) -> bool:
 
         try:
-            await websocket.send_text(message.json())
+            await websocket.send_bytes(payload_bytes)
             return True
             
         except WebSocketDisconnect:
@@ -144,29 +145,33 @@ class WebSocketManager:
     async def cleanup_stale_connections(self) -> int:
         if not self._active_connections:
             return 0
-        
-        connections = list(self._active_connections)
-        stale_connections = []
-        
-        for websocket in connections:
-            try:
-                ping_message = WebSocketMessage(
-                    type=WebSocketMessageType.PING,
-                    message="health_check"
-                )
-                await asyncio.wait_for(
-                    self._send_message(websocket, ping_message),
-                    timeout=5.0
-                )
-                
-            except (asyncio.TimeoutError, Exception):
-                stale_connections.append(websocket)
-        
+
+        connections = list(self._active_connections.values())
+
+        ping_message = WebSocketMessage(
+            type=WebSocketMessageType.PING,
+            message="health_check"
+        )
+        ping_bytes = _encode_message(ping_message)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_bytes(ping_bytes), timeout=5.0)
+                for websocket in connections
+            ),
+            return_exceptions=True
+        )
+
+        stale_connections = [
+            websocket
+            for websocket, result in zip(connections, results)
+            if isinstance(result, Exception)
+        ]
+
         if stale_connections:
-            async with self._connection_lock:
-                for stale_conn in stale_connections:
-                    self._active_connections.discard(stale_conn)
-            
+            for stale_conn in stale_connections:
+                self._active_connections.pop(id(stale_conn), None)
+
             logger.info(f"Limpeza: {len(stale_connections)} conexões stale removidas")
         
         return len(stale_connections)
\ No newline at end of file
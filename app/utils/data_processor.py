@@ -1,134 +1,218 @@
 
 import csv
 import io
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import re
+from datetime import date
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple
+
+import ciso8601
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
 from app.utils.logger import get_logger
 
 logger = get_logger("data_processor")
 
 
 class DataProcessor:
-    
+
     DATE_INDICATORS = ['data', 'date', 'created', 'updated', 'timestamp']
     NUMERIC_INDICATORS = ['valor', 'price', 'amount', 'total', 'quantidade', 'qtd', 'preco']
-    
-    @staticmethod
-    def parse_csv_content(csv_content: str) -> List[Dict[str, Any]]:
+
+    _DATE_RE = re.compile('|'.join(DATE_INDICATORS))
+    _NUM_RE = re.compile('|'.join(NUMERIC_INDICATORS))
+
+    _DATE_RX = re.compile(
+        r'^(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})/(\d{1,2})/(\d{4}))'
+        r'(?:[ T]\d{2}:\d{2}:\d{2}Z?)?$'
+    )
+
+    _NON_NUMERIC_RX = re.compile(r'[^\d.,]')
+    _SWAP_SEPARATORS = str.maketrans(',.', '.,')
+
+    @classmethod
+    def parse_csv_content(cls, csv_content: bytes) -> Tuple[List[str], List[tuple]]:
+        if not csv_content:
+            logger.warning("Conteúdo CSV vazio recebido")
+            return [], []
+
         try:
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
-            
-            raw_data = list(reader)
-            logger.info(f"CSV parseado com sucesso: {len(raw_data)} registros brutos")
-            
-            return raw_data
-            
+            header = cls._read_csv_header(csv_content)
+
+            table = pa_csv.read_csv(
+                pa.py_buffer(csv_content),
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header}
+                )
+            )
+
+            fieldnames = table.column_names
+            rows = list(zip(*(column.to_pylist() for column in table.columns)))
+            logger.info(f"CSV parseado com sucesso: {len(rows)} registros brutos")
+
+            return fieldnames, rows
+
         except Exception as e:
             logger.error(f"Erro ao fazer parse do CSV: {e}")
             raise ValueError(f"CSV inválido: {e}")
-    
+
+    @staticmethod
+    def _read_csv_header(csv_content: bytes) -> List[str]:
+        header_line = csv_content.split(b'\n', 1)[0].decode('utf-8-sig', errors='replace')
+        return next(csv.reader(io.StringIO(header_line)))
+
     @classmethod
-    def clean_and_format_data(cls, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        if not raw_data:
+    def clean_and_format_data(cls, fieldnames: List[str], rows: List[tuple]) -> List[Dict[str, Any]]:
+        if not rows:
             logger.warning("Nenhum dado para processar")
             return []
-        
+
         try:
+            schema = cls._build_schema(fieldnames)
             processed_data = []
-            
-            for i, record in enumerate(raw_data):
+
+            for i, row in enumerate(rows):
                 try:
-                    if cls._is_empty_record(record):
+                    if cls._is_empty_record(row):
                         continue
-                    
-                    processed_record = {}
-                    for key, value in record.items():
-                        clean_key = cls._clean_column_name(key)
-                        clean_value = cls._process_field_value(clean_key, value)
-                        processed_record[clean_key] = clean_value
-                    
+
+                    processed_record = {
+                        clean_key: formatter(value)
+                        for (clean_key, formatter), value in zip(schema, row)
+                    }
+
                     processed_data.append(processed_record)
-                    
+
                 except Exception as e:
                     logger.warning(f"Erro ao processar registro {i}: {e}")
                     continue
-            
+
             logger.info(f"Dados processados com sucesso: {len(processed_data)} registros válidos")
             return processed_data
-            
+
         except Exception as e:
             logger.error(f"Erro crítico no processamento de dados: {e}")
             return []
-    
+
+    @classmethod
+    def _build_schema(cls, fieldnames: List[str]) -> List[Tuple[str, Callable[[Any], str]]]:
+        return [
+            (clean_key, cls._pick_formatter(clean_key))
+            for clean_key in (cls._clean_column_name(name) for name in fieldnames)
+        ]
+
+    @classmethod
+    def _pick_formatter(cls, clean_key: str) -> Callable[[Any], str]:
+        kind = cls._classify_field(clean_key)
+
+        if kind == 'date':
+            return cls._format_date_value
+
+        if kind == 'number':
+            return cls._format_number_value
+
+        return cls._format_text_value
+
     @staticmethod
-    def _is_empty_record(record: Dict[str, Any]) -> bool:
-        return all(
-            not value or str(value).strip() == '' 
-            for value in record.values()
-        )
-    
+    def _is_empty_record(row: Sequence[Any]) -> bool:
+        for value in row:
+            if value is None:
+                continue
+
+            if isinstance(value, str):
+                if value and not value.isspace():
+                    return False
+            else:
+                return False
+
+        return True
+
     @staticmethod
     def _clean_column_name(column_name: str) -> str:
         if not column_name:
             return "unnamed_column"
         return str(column_name).strip()
-    
+
+    @classmethod
+    def _classify_field(cls, field_name: str) -> str:
+        field_lower = field_name.lower()
+
+        if cls._DATE_RE.search(field_lower):
+            return 'date'
+
+        if cls._NUM_RE.search(field_lower):
+            return 'number'
+
+        return 'text'
+
     @classmethod
-    def _process_field_value(cls, field_name: str, value: Any) -> str:
-        if value is None or str(value).strip() == '':
+    def _format_date_value(cls, value: Any) -> str:
+        if value is None:
             return ''
-        
+
         clean_value = str(value).strip()
-        field_lower = field_name.lower()
-        
-        if any(date_indicator in field_lower for date_indicator in cls.DATE_INDICATORS):
-            formatted_date = cls._try_format_date(clean_value)
-            if formatted_date:
-                return formatted_date
-        
-        elif any(num_indicator in field_lower for num_indicator in cls.NUMERIC_INDICATORS):
-            formatted_number = cls._try_format_number(clean_value)
-            if formatted_number:
-                return formatted_number
-        
-        return clean_value
-    
+        if not clean_value:
+            return ''
+
+        return cls._try_format_date(clean_value) or clean_value
+
+    @classmethod
+    def _format_number_value(cls, value: Any) -> str:
+        if value is None:
+            return ''
+
+        clean_value = str(value).strip()
+        if not clean_value:
+            return ''
+
+        return cls._try_format_number(clean_value) or clean_value
+
     @staticmethod
-    def _try_format_date(value: str) -> Optional[str]:
-        date_formats = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ'
-        ]
-        
-        for date_format in date_formats:
+    def _format_text_value(value: Any) -> str:
+        if value is None:
+            return ''
+        return str(value).strip()
+    
+    @classmethod
+    def _try_format_date(cls, value: str) -> Optional[str]:
+        match = cls._DATE_RX.match(value)
+
+        if match:
+            if match.group(1):
+                year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            else:
+                day, month, year = int(match.group(4)), int(match.group(5)), int(match.group(6))
+                if month > 12 and day <= 12:
+                    day, month = month, day
+
             try:
-                parsed_date = datetime.strptime(value, date_format)
-                return parsed_date.strftime('%d/%m/%Y')
+                date(year, month, day)
             except ValueError:
-                continue
-        
-        logger.debug(f"Não foi possível formatar como data: {value}")
-        return None
+                logger.debug(f"Não foi possível formatar como data: {value}")
+                return None
+
+            return f"{day:02d}/{month:02d}/{year:04d}"
+
+        try:
+            parsed_date = ciso8601.parse_datetime(value)
+            return parsed_date.strftime('%d/%m/%Y')
+        except ValueError:
+            logger.debug(f"Não foi possível formatar como data: {value}")
+            return None
     
-    @staticmethod
-    def _try_format_number(value: str) -> Optional[str]:
+    @classmethod
+    def _try_format_number(cls, value: str) -> Optional[str]:
         try:
-            numeric_chars = ''.join(c for c in value if c.isdigit() or c in '.,')
-            
+            numeric_chars = cls._NON_NUMERIC_RX.sub('', value)
+
             if not numeric_chars:
                 return None
-            
-            numeric_value = numeric_chars.replace(',', '.')
-            float_value = float(numeric_value)
-            
-            return f"R$ {float_value:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-            
+
+            float_value = float(numeric_chars.replace(',', '.'))
+
+            return f"R$ {float_value:,.2f}".translate(cls._SWAP_SEPARATORS)
+
         except (ValueError, TypeError):
             logger.debug(f"Não foi possível formatar como número: {value}")
             return None
\ No newline at end of file